@@ -0,0 +1,33 @@
+import subprocess
+import sys
+
+
+def import_time(statement, repeat=5):
+    """Best-of-`repeat` wall time (seconds) of `statement` in a fresh interpreter."""
+    code = (
+        "import time\n"
+        "t0 = time.perf_counter()\n"
+        f"{statement}\n"
+        "t1 = time.perf_counter()\n"
+        "import sys\n"
+        "heavy = [m for m in ('pandas', 'matplotlib') if m in sys.modules]\n"
+        "print(t1 - t0, ','.join(heavy))\n"
+    )
+    best, heavy = None, ""
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.split()
+        elapsed = float(out[0])
+        heavy = out[1] if len(out) > 1 else ""
+        best = elapsed if best is None else min(best, elapsed)
+    return best, heavy
+
+
+def main():
+    # Each statement runs in a new interpreter so module caches do not skew results.
+    for statement in ["import requests", "import dabpy", "from dabpy import TermsAPI", "from dabpy import DABClient, Constraints"]:
+        elapsed, heavy = import_time(statement)
+        print(f"{statement:<45} {elapsed * 1000:8.1f} ms   heavy modules loaded: {heavy or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
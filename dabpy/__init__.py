@@ -2,8 +2,13 @@
 from .dab_py import Term, Terms, TermsAPI
 
 # DABClient (OM API)
-from .om_api import DABClient, WHOSClient, HISCentralClient, Feature, Observation
+from .om_api import DABClient, WHOSClient, HISCentralClient, Feature, Observation, FeatureObservations
 from .constraints import Constraints, DownloadConstraints
+from .pagination import AdaptivePageSizer
+from .harvest import HarvestJob
+from .transfer import TransferStats
+from .store import TimeSeriesStore, SeriesSlice
+from .ratelimit import RateLimiter
 
 # Define what users can import directly
 __all__ = [
@@ -15,6 +20,13 @@ __all__ = [
     "HISCentralClient",
     "Feature",
     "Observation",
+    "FeatureObservations",
     "Constraints",
-    "DownloadConstraints"
+    "DownloadConstraints",
+    "AdaptivePageSizer",
+    "HarvestJob",
+    "TransferStats",
+    "TimeSeriesStore",
+    "SeriesSlice",
+    "RateLimiter"
 ]
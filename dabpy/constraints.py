@@ -1,8 +1,37 @@
+import urllib.parse
+
+
 class Constraints:
     """
     WHOS API constraints for features and observations.
     Handles optional parameters for features and observations queries.
+
+    Constraints are immutable and hashable: two instances with the same values
+    compare equal and produce the same (URL-encoded, memoized) query string, so
+    they can be used as cache, dedup or sharding keys. Use `replace`,
+    `with_bbox` or `with_time_range` to derive new constraints.
     """
+    # Query parameters, in the order they are emitted by to_query()
+    _FIELDS = (
+        "bbox",
+        "observedProperty",
+        "ontology",
+        "country",
+        "provider",
+        "feature",
+        "localFeatureIdentifier",
+        "observationIdentifier",
+        "beginPosition",
+        "endPosition",
+        "spatialRelation",
+        "predefinedLayer",
+        "timeInterpolation",
+        "intendedObservationSpacing",
+        "aggregationDuration",
+        "limit",
+        "format"
+    )
+
     def __init__(
         self,
         bbox=None,
@@ -23,68 +52,90 @@ class Constraints:
         limit=None,
         format=None
     ):
-        self.bbox = bbox
-        self.observedProperty = observedProperty
-        self.ontology = ontology
-        self.country = country
-        self.provider = provider
-        self.feature = feature
-        self.localFeatureIdentifier = localFeatureIdentifier
-        self.observationIdentifier = observationIdentifier
-        self.beginPosition = beginPosition
-        self.endPosition = endPosition
-        self.spatialRelation = spatialRelation
-        self.predefinedLayer = predefinedLayer
-        self.timeInterpolation = timeInterpolation
-        self.intendedObservationSpacing = intendedObservationSpacing
-        self.aggregationDuration = aggregationDuration
-        self.limit = limit
-        self.format = format
+        values = dict(locals())
+        del values["self"]
+        # bbox may be given as a list; store it as a tuple to keep the instance hashable
+        if values["bbox"] is not None:
+            values["bbox"] = tuple(values["bbox"])
+        self._set_fields(values)
+
+    def _set_fields(self, values):
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, "_query", None)
+        object.__setattr__(self, "_hash", None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable; use .replace({name}=...) instead")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def as_dict(self):
+        """Field values as a plain dict (suitable for `type(self)(**d)`)."""
+        return {name: getattr(self, name) for name in self._FIELDS}
+
+    def _key(self):
+        return (type(self).__name__,) + tuple(getattr(self, name) for name in self._FIELDS)
+
+    def __eq__(self, other):
+        if not isinstance(other, Constraints):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self):
+        if self._hash is None:
+            object.__setattr__(self, "_hash", hash(self._key()))
+        return self._hash
+
+    def __repr__(self):
+        set_fields = ", ".join(f"{k}={v!r}" for k, v in self.as_dict().items() if v is not None)
+        return f"{type(self).__name__}({set_fields})"
+
+    # --- Cheap derivation ---
+    def replace(self, **changes):
+        """Return a copy with the given fields changed."""
+        unknown = set(changes) - set(self._FIELDS)
+        if unknown:
+            raise TypeError(f"Unknown constraint(s): {', '.join(sorted(unknown))}")
+        values = self.as_dict()
+        values.update(changes)
+        return type(self)(**values)
+
+    def with_bbox(self, bbox):
+        """Return a copy restricted to `bbox` (south, west, north, east)."""
+        return self.replace(bbox=bbox)
+
+    def with_time_range(self, begin=None, end=None):
+        """Return a copy with the given beginPosition/endPosition."""
+        return self.replace(beginPosition=begin, endPosition=end)
+
+    def with_limit(self, limit):
+        """Return a copy with the given page size."""
+        return self.replace(limit=limit)
+
+    # --- Query encoding ---
+    def _query_items(self):
+        """(name, value) pairs of set parameters, in canonical order."""
+        items = []
+        for name in Constraints._FIELDS:
+            value = getattr(self, name)
+            if name == "bbox":
+                if value:
+                    south, west, north, east = value
+                    items += [("west", west), ("south", south), ("east", east), ("north", north)]
+            elif name == "limit":
+                if value is not None:
+                    items.append((name, value))
+            elif value:
+                items.append((name, value))
+        return items
 
     def to_query(self):
-        """Build URL query string including only set parameters."""
-        query_parts = []
-
-        if self.bbox:
-            south, west, north, east = self.bbox
-            query_parts.append(f"west={west}")
-            query_parts.append(f"south={south}")
-            query_parts.append(f"east={east}")
-            query_parts.append(f"north={north}")
-        if self.observedProperty:
-            query_parts.append(f"observedProperty={self.observedProperty}")
-        if self.ontology:
-            query_parts.append(f"ontology={self.ontology}")
-        if self.country:
-            query_parts.append(f"country={self.country}")
-        if self.provider:
-            query_parts.append(f"provider={self.provider}")
-        if self.feature:
-            query_parts.append(f"feature={self.feature}")
-        if self.localFeatureIdentifier:
-            query_parts.append(f"localFeatureIdentifier={self.localFeatureIdentifier}")
-        if self.observationIdentifier:
-            query_parts.append(f"observationIdentifier={self.observationIdentifier}")
-        if self.beginPosition:
-            query_parts.append(f"beginPosition={self.beginPosition}")
-        if self.endPosition:
-            query_parts.append(f"endPosition={self.endPosition}")
-        if self.spatialRelation:
-            query_parts.append(f"spatialRelation={self.spatialRelation}")
-        if self.predefinedLayer:
-            query_parts.append(f"predefinedLayer={self.predefinedLayer}")
-        if self.timeInterpolation:
-            query_parts.append(f"timeInterpolation={self.timeInterpolation}")
-        if self.intendedObservationSpacing:
-            query_parts.append(f"intendedObservationSpacing={self.intendedObservationSpacing}")
-        if self.aggregationDuration:
-            query_parts.append(f"aggregationDuration={self.aggregationDuration}")
-        if self.limit is not None:
-            query_parts.append(f"limit={self.limit}")
-        if self.format:
-            query_parts.append(f"format={self.format}")
-
-        return "&".join(query_parts)
+        """Build URL query string including only set parameters (URL-encoded, computed once)."""
+        if self._query is None:
+            object.__setattr__(self, "_query", urllib.parse.urlencode(self._query_items(), quote_via=urllib.parse.quote))
+        return self._query
 
 
 class DownloadConstraints(Constraints):
@@ -92,6 +143,8 @@ class DownloadConstraints(Constraints):
     Extends Constraints with download-specific parameters:
     asynchDownloadName, eMailNotifications, useCache
     """
+    _FIELDS = Constraints._FIELDS + ("asynchDownloadName", "eMailNotifications", "useCache")
+
     def __init__(
         self,
         base_constraints: Constraints = None,
@@ -100,30 +153,27 @@ class DownloadConstraints(Constraints):
         useCache=None,
         **kwargs
     ):
-        # Initialize the parent Constraints attributes
+        # Initialize the parent Constraints attributes (explicit kwargs override base_constraints)
         if base_constraints:
-            super().__init__(**base_constraints.__dict__)
+            values = {name: getattr(base_constraints, name) for name in Constraints._FIELDS}
+            values.update(kwargs)
         else:
-            super().__init__(**kwargs)
+            values = kwargs
+        super().__init__(**values)
 
         # Download-specific fields
-        self.asynchDownloadName = asynchDownloadName
-        self.eMailNotifications = eMailNotifications
-        self.useCache = useCache
+        object.__setattr__(self, "asynchDownloadName", asynchDownloadName)
+        object.__setattr__(self, "eMailNotifications", eMailNotifications)
+        object.__setattr__(self, "useCache", useCache)
 
-    def to_query(self):
-        """Build query string including inherited Constraints fields + download-specific ones."""
-        query = super().to_query()  # get all inherited fields first
-        extra = []
+    def _query_items(self):
+        """Inherited Constraints fields first, then the download-specific ones."""
+        items = super()._query_items()
 
         if self.asynchDownloadName:
-            extra.append(f"asynchDownloadName={self.asynchDownloadName}")
+            items.append(("asynchDownloadName", self.asynchDownloadName))
         if self.eMailNotifications is not None:
-            extra.append(f"eMailNotifications={str(self.eMailNotifications).lower()}")
+            items.append(("eMailNotifications", str(self.eMailNotifications).lower()))
         if self.useCache is not None:
-            extra.append(f"useCache={str(self.useCache).lower()}")
-
-        if extra:
-            query += "&" + "&".join(extra)
-
-        return query
\ No newline at end of file
+            items.append(("useCache", str(self.useCache).lower()))
+        return items
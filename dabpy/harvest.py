@@ -0,0 +1,183 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+
+
+class HarvestJob:
+    """
+    Checkpointed, resumable harvest of DAB features / observations.
+
+    Records are appended to `output_path` as JSON lines (one OM-JSON item per
+    line). After every page (or every observation with data) the output is
+    flushed to disk and a small JSON checkpoint is written atomically with the
+    resumption token (or the position in the observation ID list) and the
+    output offset.
+    Re-running the same job after a crash truncates any partially written
+    output back to the last checkpoint and continues from there, so no
+    completed page or observation is fetched twice.
+    """
+    def __init__(self, client, checkpoint_path, output_path, verbose=True):
+        self.client = client
+        self.checkpoint_path = Path(checkpoint_path)
+        self.output_path = Path(output_path)
+        self.verbose = verbose
+        self.state = self._load_checkpoint()
+
+    # --- Checkpoint handling ---
+    def _load_checkpoint(self):
+        if not self.checkpoint_path.exists():
+            return None
+        with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save_checkpoint(self):
+        # Write to a temporary file and rename, so a crash never leaves a half-written checkpoint
+        tmp_path = self.checkpoint_path.with_name(self.checkpoint_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def _check_checkpoint(self, kind, key):
+        """Refuse to reuse a checkpoint written by a different harvest."""
+        if self.state is not None and (self.state["kind"] != kind or self.state["key"] != key):
+            raise ValueError(
+                f"Checkpoint {self.checkpoint_path} belongs to a different harvest "
+                f"({self.state['kind']}: {self.state['key']}); use a new checkpoint path."
+            )
+
+    def _start(self, kind, key):
+        """Resume a matching checkpoint or start a new one; return the output file opened for appending."""
+        self._check_checkpoint(kind, key)
+        if self.state is not None:
+            if self.verbose:
+                print(f"Resuming harvest from {self.checkpoint_path} "
+                      f"({self.state['records_written']} records already written).")
+        else:
+            if os.path.exists(self.output_path) and os.path.getsize(self.output_path) > 0:
+                # Without a checkpoint the existing content is not ours to truncate
+                raise FileExistsError(
+                    f"Output {self.output_path} already exists and is not empty, but there is no "
+                    f"checkpoint at {self.checkpoint_path}; use a new output path or remove the file."
+                )
+            self.state = {
+                "kind": kind,
+                "key": key,
+                "page": 0,
+                "resumption_token": None,
+                "completed": False,
+                "position": 0,
+                "records_written": 0,
+                "output_offset": 0
+            }
+            self._save_checkpoint()
+
+        # Drop anything written after the last checkpoint (e.g. a page interrupted mid-write)
+        out = open(self.output_path, "a+b")
+        out.truncate(self.state["output_offset"])
+        out.seek(0, os.SEEK_END)
+        return out
+
+    def _commit(self, out, records, **updates):
+        """Append `records` to the output, then checkpoint the new offset together with `updates`."""
+        for record in records:
+            out.write(json.dumps(record).encode("utf-8") + b"\n")
+        out.flush()
+        os.fsync(out.fileno())
+        self.state.update(updates)
+        self.state["records_written"] += len(records)
+        self.state["output_offset"] = out.tell()
+        self._save_checkpoint()
+
+    @property
+    def completed(self):
+        return bool(self.state and self.state["completed"])
+
+    def to_dict(self):
+        if not self.state:
+            return {"Status": "not started"}
+        return {
+            "Kind": self.state["kind"],
+            "Pages": self.state["page"],
+            "Records Written": self.state["records_written"],
+            "Output Offset": self.state["output_offset"],
+            "Completed Observations": self.state.get("position", 0),
+            "Status": "completed" if self.state["completed"] else "in progress"
+        }
+
+    def __repr__(self):
+        return f"<HarvestJob checkpoint={self.checkpoint_path} state={self.to_dict()}>"
+
+    # --- Harvests ---
+    def run_pages(self, constraints, endpoint="features", max_pages=None, adaptive=None):
+        """
+        Harvest all pages of `features` or `observations` matching `constraints`.
+        Stops after `max_pages` new pages if given; call again to continue.
+        """
+        if endpoint not in ("features", "observations"):
+            raise ValueError('endpoint must be "features" or "observations"')
+        key = constraints.to_query()
+        self._check_checkpoint(endpoint, key)
+        if self.completed:
+            if self.verbose:
+                print("Harvest already completed.")
+            return self
+
+        items_key = "results" if endpoint == "features" else "member"
+        page_sizer = self.client._page_sizer(adaptive, constraints)
+        fetched = 0
+        with self._start(endpoint, key) as out:
+            while not self.state["completed"] and (max_pages is None or fetched < max_pages):
+                page = self.state["page"] + 1
+                data = self.client._get_page(endpoint, constraints, self.state["resumption_token"], page,
+                                             page_sizer, self.verbose)
+                items = data.get(items_key, [])
+                token = data.get("resumptionToken")
+                resumption_token = token.split(",")[0] if token else None
+                self._commit(out, items, page=page, resumption_token=resumption_token,
+                             completed=data.get("completed", True) or not resumption_token)
+                fetched += 1
+                if self.verbose:
+                    print(f"Page {page}: {len(items)} {endpoint} written "
+                          f"({self.state['records_written']} total).")
+        return self
+
+    def run_observation_data(self, observation_ids, begin=None, end=None):
+        """
+        Harvest data points for each observation ID (see DABClient.get_observation_with_data).
+        Observations already recorded in the checkpoint are skipped. IDs are
+        processed in order; the checkpoint keeps a hash of the ID list and the
+        position reached, so its size does not grow with the batch.
+        """
+        observation_ids = list(dict.fromkeys(observation_ids))
+        key = hashlib.sha1(json.dumps({"ids": observation_ids, "begin": begin, "end": end})
+                           .encode("utf-8")).hexdigest()
+        self._check_checkpoint("observation_data", key)
+        if self.completed:
+            if self.verbose:
+                print("Harvest already completed.")
+            return self
+
+        with self._start("observation_data", key) as out:
+            for position in range(self.state["position"], len(observation_ids)):
+                obs_json = self.client._get_observation_data_json(observation_ids[position], begin, end,
+                                                                  verbose=self.verbose)
+                self._commit(out, [obs_json] if obs_json is not None else [], position=position + 1)
+            self.state["completed"] = True
+            self._save_checkpoint()
+        return self
+
+    # --- Reading back ---
+    def records(self):
+        """Iterate over the harvested OM-JSON records (up to the last checkpoint)."""
+        if not self.state:
+            return
+        limit = self.state["output_offset"]
+        with open(self.output_path, "rb") as f:
+            while f.tell() < limit:
+                line = f.readline()
+                if not line:
+                    break
+                yield json.loads(line)
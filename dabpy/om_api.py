@@ -1,14 +1,35 @@
 import requests
-import pandas as pd
 import urllib.parse
-import matplotlib.pyplot as plt
 from datetime import datetime
 from pathlib import Path
 import time
-
-pd.set_option("display.max_columns", None)
-pd.set_option("display.max_colwidth", None)
-pd.set_option("display.expand_frame_repr", False)
+from concurrent.futures import ThreadPoolExecutor
+
+from .pagination import AdaptivePageSizer
+from .transfer import TransferStats, accept_encoding, read_json, stream_to_file
+from .store import SeriesSlice
+from .ratelimit import parse_retry_after
+
+# --- Optional heavy dependencies (imported on first use) ---
+def _pandas():
+    """Import pandas lazily so that `import dabpy` stays lightweight."""
+    try:
+        import pandas
+    except ImportError as e:
+        raise ImportError(
+            "pandas is required for DataFrame conversion. Install it with: pip install dab-py[pandas]"
+        ) from e
+    return pandas
+
+def _pyplot():
+    """Import matplotlib.pyplot lazily, only when plotting is requested."""
+    try:
+        import matplotlib.pyplot
+    except ImportError as e:
+        raise ImportError(
+            "matplotlib is required for plotting. Install it with: pip install dab-py[plot]"
+        ) from e
+    return matplotlib.pyplot
 
 # --- Feature and Observation classes ---
 class Feature:
@@ -35,6 +56,15 @@ class Feature:
     def __repr__(self):
         return f"<Feature id={self.id} name={self.name}>"
 
+def _resolve_feature(ref, feature_ids):
+    """Feature id referenced by `ref` (an id or an href whose last path segment is the id), or None."""
+    if not ref:
+        return None
+    if ref in feature_ids:
+        return ref
+    tail = ref.split("?", 1)[0].rstrip("/").rsplit("/", 1)[-1]
+    return tail if tail in feature_ids else None
+
 class Observation:
     def __init__(self, obs_json):
         params = {param["name"]: param["value"] for param in obs_json.get("parameter", [])}
@@ -44,6 +74,9 @@ class Observation:
         self.phenomenon_time_begin = obs_json.get("phenomenonTime", {}).get("begin")
         self.phenomenon_time_end = obs_json.get("phenomenonTime", {}).get("end")
         self.points = obs_json.get("result", {}).get("points", [])
+        # OM-JSON references the monitoring point as featureOfInterest.href
+        foi = obs_json.get("featureOfInterest") or {}
+        self.feature_id = foi.get("href") or foi.get("id")
 
     def to_dict(self):
         return {
@@ -103,7 +136,8 @@ class DeleteResult:
 # --- Collections with per-page support ---
 class FeaturesCollection:
     """Collection of features with per-page pagination."""
-    def __init__(self, client, constraints, initial_features=None, resumption_token=None, page=1, verbose=True):
+    def __init__(self, client, constraints, initial_features=None, resumption_token=None, page=1, verbose=True,
+                 page_sizer=None):
         self.client = client
         self.constraints = constraints
         self.features = initial_features or []
@@ -112,6 +146,7 @@ class FeaturesCollection:
         self.completed = False
         self.page = page
         self.verbose = verbose
+        self.page_sizer = page_sizer
         if self.verbose:
             self._print_summary(len(self.current_page_features))
 
@@ -126,13 +161,9 @@ class FeaturesCollection:
             print("No more data to fetch.")
             return self
 
-        url = f"{self.client.base_url}features?{self.constraints.to_query()}&resumptionToken={urllib.parse.quote(self.resumption_token)}"
         self.page += 1
-        if self.verbose:
-            print(f"Retrieving page {self.page}: {url.replace(self.client.token, '***')}")
-        resp = requests.get(url)
-        resp.raise_for_status()
-        data = resp.json()
+        data = self.client._get_page("features", self.constraints, self.resumption_token, self.page,
+                                     self.page_sizer, self.verbose)
 
         new_features = [Feature(f) for f in data.get("results", [])]
         self.current_page_features = new_features
@@ -147,7 +178,7 @@ class FeaturesCollection:
         return self
 
     def to_df(self):
-        return pd.DataFrame([f.to_dict() for f in self.current_page_features])
+        return _pandas().DataFrame([f.to_dict() for f in self.current_page_features])
 
     def _print_summary(self, n_returned):
         prefix = "first" if self.page == 1 else "next"
@@ -161,7 +192,8 @@ class FeaturesCollection:
 
 class ObservationsCollection:
     """Collection of observations with per-page pagination."""
-    def __init__(self, client, constraints, initial_obs=None, resumption_token=None, page=1, verbose=True):
+    def __init__(self, client, constraints, initial_obs=None, resumption_token=None, page=1, verbose=True,
+                 page_sizer=None):
         self.client = client
         self.constraints = constraints
         self.observations = initial_obs or []
@@ -170,6 +202,7 @@ class ObservationsCollection:
         self.completed = False
         self.page = page
         self.verbose = verbose
+        self.page_sizer = page_sizer
         if self.verbose:
             self._print_summary(len(self.current_page_obs))
 
@@ -184,13 +217,9 @@ class ObservationsCollection:
             print("No more data to fetch.")
             return self
 
-        url = f"{self.client.base_url}observations?{self.constraints.to_query()}&resumptionToken={urllib.parse.quote(self.resumption_token)}"
         self.page += 1
-        if self.verbose:
-            print(f"Retrieving page {self.page}: {url.replace(self.client.token, '***')}")
-        resp = requests.get(url)
-        resp.raise_for_status()
-        data = resp.json()
+        data = self.client._get_page("observations", self.constraints, self.resumption_token, self.page,
+                                     self.page_sizer, self.verbose)
 
         new_obs = [Observation(o) for o in data.get("member", [])]
         self.current_page_obs = new_obs
@@ -205,7 +234,7 @@ class ObservationsCollection:
         return self
 
     def to_df(self):
-        return pd.DataFrame([o.to_dict() for o in self.current_page_obs])
+        return _pandas().DataFrame([o.to_dict() for o in self.current_page_obs])
 
     def _print_summary(self, n_returned):
         prefix = "first" if self.page == 1 else "next"
@@ -231,17 +260,55 @@ class DownloadsCollection:
         return self.downloads[idx]
 
     def to_df(self):
-        return pd.DataFrame([d.to_dict() for d in self.downloads])
+        return _pandas().DataFrame([d.to_dict() for d in self.downloads])
 
     def __repr__(self):
         return f"<DownloadsCollection count={len(self.downloads)}>"
 
+class FeatureObservations:
+    """Features joined locally with their observations, indexed by feature id."""
+    def __init__(self, features, observations_by_feature, round_trips=0):
+        self.features = {f.id: f for f in features}
+        self.observations = {fid: observations_by_feature.get(fid, []) for fid in self.features}
+        self.round_trips = round_trips
+
+    def __len__(self):
+        return len(self.features)
+
+    def __getitem__(self, feature_id):
+        return self.observations[feature_id]
+
+    def __iter__(self):
+        for fid, feature in self.features.items():
+            yield feature, self.observations[fid]
+
+    def to_df(self):
+        """One row per (feature, observation); features without observations get one empty row."""
+        rows = []
+        for feature, observations in self:
+            feature_row = {f"Feature {k}": v for k, v in feature.to_dict().items()}
+            if not observations:
+                rows.append(feature_row)
+            for obs in observations:
+                rows.append({**feature_row, **{f"Observation {k}": v for k, v in obs.to_dict().items()}})
+        return _pandas().DataFrame(rows)
+
+    def __repr__(self):
+        n_obs = sum(len(o) for o in self.observations.values())
+        return f"<FeatureObservations features={len(self.features)} observations={n_obs} round_trips={self.round_trips}>"
+
 # --- Main DAB Client Class ---
 class DABClient:
     """Generic DAB client for retrieving features and observations."""
-    def __init__(self, token="{token}", view="{view}", base_url_template=None):
+    def __init__(self, token="{token}", view="{view}", base_url_template=None, compression=True,
+                 rate_limiter=None):
         self.token = token
         self.view = view
+        # Negotiate gzip/deflate (and br/zstd when installed) and track wire vs. decoded bytes
+        self.compression = compression
+        self.transfer_stats = TransferStats()
+        # Optional RateLimiter (may be shared between clients / threads)
+        self.rate_limiter = rate_limiter
         # Use provided template or default generic template
         if base_url_template:
             self.base_url_template = base_url_template
@@ -285,74 +352,286 @@ class DABClient:
         url = self._obfuscate_download_id_in_url(url)
         return url
 
-    def get_features(self, constraints, verbose=True):
-        url = f"{self.base_url}features?{constraints.to_query()}"
-        if verbose:
-            print(f"Retrieving page 1: {self._obfuscate_token(url)}")
-        resp = requests.get(url)
-        resp.raise_for_status()
-        data = resp.json()
+    def _request(self, method, url, kind="other", consume=None, exchange=None, **kwargs):
+        """
+        Send one HTTP request, honouring the client's rate limiter (if any):
+        wait for a slot/token for (host, kind) and retry after 429 / Retry-After.
+
+        With `consume`, the (streamed) response is passed to `consume(resp)` while the
+        limiter slot is still held, then closed, and the callback's result is returned.
+        `exchange` (a dict) receives the "seconds" spent on the HTTP exchange itself,
+        excluding limiter waits and Retry-After pauses.
+        """
+        def send():
+            start = time.perf_counter()
+            resp = requests.request(method, url, **kwargs)
+            return resp, start
+
+        def finish(resp, start):
+            if consume is None:
+                result = resp
+            else:
+                with resp:
+                    result = consume(resp)
+            if exchange is not None:
+                exchange["seconds"] = time.perf_counter() - start
+            return result
+
+        if not self.rate_limiter:
+            return finish(*send())
+
+        for attempt in range(self.rate_limiter.max_retries + 1):
+            with self.rate_limiter.slot(url, kind) as governor:
+                resp, start = send()
+                retry_after = self.rate_limiter.record(governor, resp)
+                if retry_after is None or attempt == self.rate_limiter.max_retries:
+                    return finish(resp, start)
+                resp.close()
+            if retry_after:
+                print(f"Throttled by server, waiting {retry_after:.1f}s before retrying {kind} request.")
+
+    def _get_json(self, url, kind="other", timeout=None, exchange=None):
+        """
+        GET `url` as a compressed stream and decode the JSON body while decompressing.
+        `exchange` (a dict) receives the HTTP time and the wire/decoded size of this call.
+        """
+        def consume(resp):
+            resp.raise_for_status()
+            return read_json(resp, self.transfer_stats, exchange=exchange)
+
+        return self._request("GET", url, kind, consume=consume, exchange=exchange,
+                             headers={"Accept-Encoding": accept_encoding(self.compression)},
+                             stream=True, timeout=timeout)
+
+    def _get_page(self, endpoint, constraints, resumption_token=None, page=1, page_sizer=None, verbose=True):
+        """
+        GET one page of `features` or `observations` and return the decoded JSON.
+        With a `page_sizer`, `limit` is chosen adaptively and timeouts / throttling /
+        server errors are retried with a smaller page.
+        """
+        attempts = 0
+        while True:
+            page_constraints = constraints.with_limit(page_sizer.limit) if page_sizer else constraints
+
+            url = f"{self.base_url}{endpoint}?{page_constraints.to_query()}"
+            if resumption_token:
+                url += f"&resumptionToken={urllib.parse.quote(resumption_token)}"
+            if verbose:
+                print(f"Retrieving page {page}: {self._obfuscate_token(url)}")
+
+            if not page_sizer:
+                return self._get_json(url, endpoint)
+
+            requested = page_sizer.limit
+            # Only the HTTP exchange is timed: rate-limiter waits would otherwise look like slow pages
+            exchange = {}
+            try:
+                data = self._get_json(url, endpoint, timeout=page_sizer.timeout, exchange=exchange)
+            except (requests.Timeout, requests.ConnectionError, requests.exceptions.ChunkedEncodingError,
+                    requests.HTTPError) as e:
+                status = getattr(e.response, "status_code", None) if isinstance(e, requests.HTTPError) else None
+                attempts += 1
+                if status == 429:
+                    # Throttling is not caused by the page size: wait as told and retry the same page
+                    retry_after = parse_retry_after(e.response.headers.get("Retry-After"))
+                    if retry_after is None or attempts > page_sizer.max_retries:
+                        raise
+                    if verbose:
+                        print(f"Page {page} throttled, waiting {retry_after:.1f}s before retrying.")
+                    time.sleep(retry_after)
+                    continue
+                # Timeouts, truncated bodies and 5xx are treated as "page too large"
+                if (status is not None and status < 500) or attempts > page_sizer.max_retries:
+                    raise
+                page_sizer.record_error(requested, e)
+                if verbose:
+                    print(f"Page {page} failed ({type(e).__name__}), retrying with limit={page_sizer.limit}")
+                continue
+
+            elapsed = exchange["seconds"]
+            items = data.get("results" if endpoint == "features" else "member", [])
+            page_sizer.record_success(requested, len(items), elapsed, exchange["decoded_bytes"],
+                                      data.get("completed", True) or not data.get("resumptionToken"))
+            if verbose:
+                print(f"Adaptive page size: {requested} requested, {len(items)} returned in {elapsed:.2f}s "
+                      f"→ next limit={page_sizer.limit}")
+            return data
+
+    def _page_sizer(self, adaptive, constraints=None):
+        """
+        Normalize the `adaptive` argument: True → default sizer, sizer instance → as is.
+        A default sizer starts from the caller's `constraints.limit` when one is set.
+        """
+        if adaptive is True:
+            page_sizer = AdaptivePageSizer()
+            if constraints is not None and constraints.limit is not None:
+                page_sizer.limit = page_sizer._clamp(constraints.limit)
+            return page_sizer
+        return adaptive or None
+
+    def get_features(self, constraints, verbose=True, adaptive=None):
+        """
+        GET the first page of features. Pass `adaptive=True` (or an AdaptivePageSizer)
+        to tune `limit` per page from observed latency, payload size and errors.
+        """
+        page_sizer = self._page_sizer(adaptive, constraints)
+        data = self._get_page("features", constraints, page=1, page_sizer=page_sizer, verbose=verbose)
 
         features_list = [Feature(f) for f in data.get("results", [])]
         token = data.get("resumptionToken")
         resumption_token = token.split(",")[0] if token else None
-        collection = FeaturesCollection(self, constraints, features_list, resumption_token, page=1, verbose=verbose)
+        collection = FeaturesCollection(self, constraints, features_list, resumption_token, page=1, verbose=verbose,
+                                        page_sizer=page_sizer)
         collection.completed = data.get("completed", True)
         return collection
 
-    def get_observations(self, constraints, verbose=True):
-        url = f"{self.base_url}observations?{constraints.to_query()}"
-        if verbose:
-            print(f"Retrieving page 1: {self._obfuscate_token(url)}")
-        resp = requests.get(url)
-        resp.raise_for_status()
-        data = resp.json()
+    def get_observations(self, constraints, verbose=True, adaptive=None):
+        """
+        GET the first page of observations. Pass `adaptive=True` (or an AdaptivePageSizer)
+        to tune `limit` per page from observed latency, payload size and errors.
+        """
+        page_sizer = self._page_sizer(adaptive, constraints)
+        data = self._get_page("observations", constraints, page=1, page_sizer=page_sizer, verbose=verbose)
 
         obs_list = [Observation(o) for o in data.get("member", [])]
         token = data.get("resumptionToken")
         resumption_token = token.split(",")[0] if token else None
-        collection = ObservationsCollection(self, constraints, obs_list, resumption_token, page=1, verbose=verbose)
+        collection = ObservationsCollection(self, constraints, obs_list, resumption_token, page=1, verbose=verbose,
+                                            page_sizer=page_sizer)
         collection.completed = data.get("completed", True)
         return collection
 
-    def get_observation_with_data(self, observation_id, begin=None, end=None):
+    def _get_observation_data_json(self, observation_id, begin=None, end=None, verbose=True):
+        """GET the raw OM-JSON member (with data points) of one observation, or None if empty."""
         url = self.base_url + f"observations?includeData=true&observationIdentifier={urllib.parse.quote(observation_id)}"
         if begin:
             url += "&beginPosition=" + urllib.parse.quote(begin)
         if end:
             url += "&endPosition=" + urllib.parse.quote(end)
-        print("Retrieving " + self._obfuscate_token(url))
-        resp = requests.get(url)
-        resp.raise_for_status()
-        data = resp.json()
+        if verbose:
+            print("Retrieving " + self._obfuscate_token(url))
+        data = self._get_json(url, "observations")
         if "member" not in data or not data["member"]:
+            return None
+        return data["member"][0]
+
+    def _get_all(self, endpoint, constraints, verbose=False):
+        """Fetch every page of `endpoint`; returns (items, number of requests)."""
+        items_key = "results" if endpoint == "features" else "member"
+        items, resumption_token, page = [], None, 0
+        while True:
+            page += 1
+            data = self._get_page(endpoint, constraints, resumption_token, page, verbose=verbose)
+            items.extend(data.get(items_key, []))
+            token = data.get("resumptionToken")
+            resumption_token = token.split(",")[0] if token else None
+            if data.get("completed", True) or not resumption_token:
+                return items, page
+
+    def get_features_with_observations(self, constraints, strategy="bulk", max_workers=4, verbose=True):
+        """
+        Fetch all features matching `constraints` together with their observations,
+        joined locally by feature id (instead of one get_observations call per feature).
+
+        strategy="bulk": page through observations with the same constraints (bbox, provider, ...)
+        in one pass and join them on their feature reference (an id, or an href ending in the id).
+        Features without observations in that pass are taken to have none. Only if some observations
+        carry a missing or unrecognized reference do the unmatched features fall back to per-feature
+        calls, which costs at least one extra request per such feature.
+        strategy="per_feature": one (paginated) observations query per feature, `max_workers` at a time.
+        """
+        if strategy not in ("bulk", "per_feature"):
+            raise ValueError('strategy must be "bulk" or "per_feature"')
+
+        feature_items, round_trips = self._get_all("features", constraints)
+        features = [Feature(f) for f in feature_items]
+        by_feature = {f.id: [] for f in features}
+
+        pending = list(by_feature)
+        if strategy == "bulk" and features:
+            obs_items, requests_made = self._get_all("observations", constraints)
+            round_trips += requests_made
+            unresolved = 0
+            for obs in map(Observation, obs_items):
+                feature_id = _resolve_feature(obs.feature_id, by_feature)
+                if feature_id is None:
+                    unresolved += 1
+                else:
+                    by_feature[feature_id].append(obs)
+            # An unmatched feature only needs its own query when some observation could not be attributed
+            pending = [fid for fid, matched in by_feature.items() if not matched] if unresolved else []
+            if verbose and pending:
+                print(f"{unresolved} observations have an unrecognized feature reference; "
+                      f"querying {len(pending)} unmatched features individually.")
+
+        if pending:
+            def fetch(feature_id):
+                return feature_id, self._get_all("observations", constraints.replace(feature=feature_id))
+
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                for feature_id, (obs_items, requests_made) in pool.map(fetch, pending):
+                    by_feature[feature_id] = [Observation(o) for o in obs_items]
+                    round_trips += requests_made
+
+        joined = FeatureObservations(features, by_feature, round_trips)
+        if verbose:
+            n_obs = sum(len(o) for o in by_feature.values())
+            print(f"Joined {n_obs} observations to {len(features)} features in {round_trips} requests.")
+        return joined
+
+    def get_observation_with_data(self, observation_id, begin=None, end=None):
+        obs_json = self._get_observation_data_json(observation_id, begin, end)
+        if obs_json is None:
             print("No observation data available for the requested time range.")
             return None
-        return Observation(data["member"][0])
+        return Observation(obs_json)
+
+    def update_store(self, store, observation_id, end=None):
+        """
+        Fetch points newer than the last one held in `store` (a TimeSeriesStore) and append them.
+        Returns the number of points added.
+        """
+        begin = store.last_time(observation_id)
+        obs = self.get_observation_with_data(observation_id, begin=begin, end=end)
+        if obs is None:
+            return 0
+        added = store.append(obs)
+        print(f"Stored {added} new points for observation {observation_id}.")
+        return added
 
     # Generic helpers
     def features_to_df(self, features):
         if not features:
-            return pd.DataFrame()
-        return pd.DataFrame([f.to_dict() for f in features])
+            return _pandas().DataFrame()
+        return _pandas().DataFrame([f.to_dict() for f in features])
 
     def observations_to_df(self, observations):
         if not observations:
-            return pd.DataFrame()
-        return pd.DataFrame([o.to_dict() for o in observations])
+            return _pandas().DataFrame()
+        return _pandas().DataFrame([o.to_dict() for o in observations])
 
     def points_to_df(self, observation):
+        if isinstance(observation, SeriesSlice):
+            return observation.to_df()
         if not observation or not observation.points:
-            return pd.DataFrame(columns=["Time", "Value"])
-        return pd.DataFrame(
+            return _pandas().DataFrame(columns=["Time", "Value"])
+        return _pandas().DataFrame(
             [{"Time": p.get("time", {}).get("instant"), "Value": p.get("value")} for p in observation.points])
 
-    def plot_observation(self, obs, title=None):
+    def plot_observation(self, obs, title=None, downsample=None, max_points=None, filename=None):
+        """
+        Plot one observation. With `downsample` ("minmax" / "lttb") or `filename`,
+        delegates to `plot_observations` (decimated, optionally rendered headless to a file).
+        """
+        if downsample or filename:
+            return self.plot_observations([obs], title=title, downsample=downsample, max_points=max_points,
+                                          filename=filename)
         if not obs or not obs.points:
             print("No data points available for this observation.")
             return
         times = [datetime.fromisoformat(p["time"]["instant"].replace("Z", "+00:00")) for p in obs.points]
         values = [p["value"] for p in obs.points]
+        plt = _pyplot()
         plt.figure(figsize=(10, 5))
         plt.plot(times, values, "o-", label=obs.observed_property)
         plt.title(title or f"{obs.observed_property} time series")
@@ -364,6 +643,17 @@ class DABClient:
         plt.tight_layout()
         plt.show()
 
+    def plot_observations(self, observations, title=None, downsample="minmax", max_points=None, layout="shared",
+                          ncols=2, figsize=(10, 5), dpi=100, filename=None):
+        """
+        Plot many (long) observations, downsampled to screen resolution.
+        layout="shared" overlays them on one axes, layout="grid" draws small multiples;
+        `filename` renders headless to a file for batch reports. See dabpy.plotting.
+        """
+        from .plotting import plot_observations
+        return plot_observations(observations, title=title, downsample=downsample, max_points=max_points,
+                                 layout=layout, ncols=ncols, figsize=figsize, dpi=dpi, filename=filename)
+
     # --- DOWNLOADS ---
     def create_download(self, download_constraints):
         """PUT: Submit a new download."""
@@ -373,7 +663,7 @@ class DABClient:
         print(f'DOWNLOAD URL: {self._obfuscate_token(url)}')
 
         # Make the PUT request
-        resp = requests.put(url)
+        resp = self._request("PUT", url, "downloads")
         resp.raise_for_status()
 
         # Create Download object from response
@@ -394,7 +684,7 @@ class DABClient:
         if verbose:
             print(f'STATUS URL: {self._obfuscate_token(url)}')  # always print by default
 
-        resp = requests.get(url)
+        resp = self._request("GET", url, "downloads")
         resp.raise_for_status()
         data = resp.json()
         downloads_list = [Download(d, client=self) for d in data.get("results", [])]
@@ -408,7 +698,7 @@ class DABClient:
         url = self.base_url + f"downloads?id={urllib.parse.quote(download_id)}"
         print(f'Deleting ID "{download_id}" ...\nDELETE URL: {self._obfuscate_token(url)}\"')
 
-        resp = requests.delete(url)
+        resp = self._request("DELETE", url, "downloads")
         resp.raise_for_status()
 
         return DeleteResult(download_id)
@@ -455,13 +745,14 @@ class DABClient:
                 save_path = save_dir / f"{base} ({i}){ext}"
                 i += 1
 
-        response = requests.get(locator, stream=True)
-        response.raise_for_status()
+        def consume(response):
+            response.raise_for_status()
+            with open(save_path, "wb") as f:
+                stream_to_file(response, f, self.transfer_stats)
 
-        with open(save_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
+        # The download body is streamed while the limiter's "downloads" slot is held
+        self._request("GET", locator, "downloads", consume=consume,
+                      headers={"Accept-Encoding": accept_encoding(self.compression)}, stream=True)
 
         print(f"Download complete!\nFile saved to: {save_path}")
         return save_path
@@ -493,12 +784,12 @@ class DABClient:
 
 # Client subclasses
 class WHOSClient(DABClient):
-    def __init__(self, token, view="whos"):
+    def __init__(self, token, view="whos", **kwargs):
         base_url_template = "https://whos.geodab.eu/gs-service/services/essi/token/{token}/view/{view}/om-api/"
-        super().__init__(token, view, base_url_template)
+        super().__init__(token, view, base_url_template, **kwargs)
 
 
 class HISCentralClient(DABClient):
-    def __init__(self, token, view="his-central"):
+    def __init__(self, token, view="his-central", **kwargs):
         base_url_template = "https://his-central.geodab.eu/gs-service/services/essi/token/{token}/view/{view}/om-api/"
-        super().__init__(token, view, base_url_template)
\ No newline at end of file
+        super().__init__(token, view, base_url_template, **kwargs)
\ No newline at end of file
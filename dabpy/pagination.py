@@ -0,0 +1,148 @@
+class AdaptivePageSizer:
+    """
+    Tunes the page size (`limit`) of paginated features/observations requests.
+
+    After every page the observed latency, payload size and returned count are
+    used to estimate the cost of a single item, and the next `limit` is chosen
+    so that a page takes about `target_seconds` and stays below `max_bytes`.
+    Timeouts and server errors shrink the page size. Pages that come back
+    shorter than requested with the same count `cap_evidence` times (while more
+    data is available) pin that count as the server-side maximum; a single sparse
+    page does not. The pinned cap is only ever lowered by such evidence, and
+    after `probe_after` full pages at the cap one larger page is tried: if it
+    comes back full the cap is dropped.
+    """
+    def __init__(
+        self,
+        initial_limit=50,
+        min_limit=1,
+        max_limit=1000,
+        target_seconds=2.0,
+        max_bytes=None,
+        timeout=30,
+        max_retries=3,
+        smoothing=0.5,
+        cap_evidence=2,
+        probe_after=3
+    ):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Expected 1 <= min_limit <= initial_limit <= max_limit")
+        self.limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.target_seconds = target_seconds
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.smoothing = smoothing
+        self.cap_evidence = cap_evidence
+        self.probe_after = probe_after
+        self.server_limit = None
+        self._short_counts = {}
+        self._full_at_cap = 0
+        self.errors = 0
+        self.requests = 0
+        self.history = []
+        self._seconds_per_item = None
+        self._bytes_per_item = None
+
+    def _clamp(self, limit, probe=False):
+        upper = self.max_limit
+        if self.server_limit is not None:
+            # A probe may ask for up to twice the pinned cap
+            upper = min(upper, self.server_limit * 2 if probe else self.server_limit)
+        return max(self.min_limit, min(upper, int(limit)))
+
+    def _smooth(self, previous, observed):
+        if previous is None:
+            return observed
+        return self.smoothing * observed + (1 - self.smoothing) * previous
+
+    def record_success(self, requested, returned, seconds, n_bytes, completed):
+        """Update the estimates from a successful page and pick the next limit."""
+        self.requests += 1
+        self.history.append({
+            "Limit": requested,
+            "Returned": returned,
+            "Seconds": round(seconds, 3),
+            "Bytes": n_bytes,
+            "Error": None
+        })
+
+        self._update_server_limit(requested, returned, completed)
+
+        if returned:
+            self._seconds_per_item = self._smooth(self._seconds_per_item, seconds / returned)
+            self._bytes_per_item = self._smooth(self._bytes_per_item, n_bytes / returned)
+
+        # After enough full pages at the pinned cap, try one larger page
+        probe = self.server_limit is not None and self._full_at_cap >= self.probe_after
+        if probe:
+            self._full_at_cap = 0
+
+        if not self._seconds_per_item:
+            # Nothing measurable (empty or instant page): grow cautiously
+            self.limit = self._clamp(self.limit * 2, probe)
+            return self.limit
+
+        candidate = self.target_seconds / self._seconds_per_item
+        if self.max_bytes and self._bytes_per_item:
+            candidate = min(candidate, self.max_bytes / self._bytes_per_item)
+
+        # Do not grow more than 2x per page to avoid jumping straight into a timeout
+        self.limit = self._clamp(min(candidate, self.limit * 2), probe)
+        return self.limit
+
+    def _update_server_limit(self, requested, returned, completed):
+        """Infer (or drop) the server-side page cap from the returned count."""
+        if completed:
+            return
+        if 0 < returned < requested:
+            # Short page: a sparse page looks the same as a capped one, so require repeated evidence
+            seen = self._short_counts.get(returned, 0) + 1
+            self._short_counts[returned] = seen
+            if seen >= self.cap_evidence and (self.server_limit is None or returned < self.server_limit):
+                self.server_limit = returned
+        elif returned == requested and self.server_limit is not None:
+            if requested > self.server_limit:
+                # A probe above the cap came back full: the cap was not real
+                self.server_limit = None
+                self._short_counts.clear()
+                self._full_at_cap = 0
+            elif requested == self.server_limit:
+                self._full_at_cap += 1
+
+    def record_error(self, requested, error):
+        """Shrink the page size after a timeout, truncated body or server error."""
+        self.requests += 1
+        self.errors += 1
+        self.history.append({
+            "Limit": requested,
+            "Returned": 0,
+            "Seconds": None,
+            "Bytes": 0,
+            "Error": type(error).__name__
+        })
+        self.limit = self._clamp(requested // 2)
+        return self.limit
+
+    @property
+    def error_rate(self):
+        return self.errors / self.requests if self.requests else 0.0
+
+    def chosen_limits(self):
+        """Page sizes requested so far, in order (including failed attempts)."""
+        return [h["Limit"] for h in self.history]
+
+    def to_dict(self):
+        return {
+            "Current Limit": self.limit,
+            "Server Limit": self.server_limit,
+            "Requests": self.requests,
+            "Errors": self.errors,
+            "Error Rate": round(self.error_rate, 3),
+            "Chosen Limits": self.chosen_limits()
+        }
+
+    def __repr__(self):
+        return f"<AdaptivePageSizer limit={self.limit} server_limit={self.server_limit} error_rate={self.error_rate:.2f}>"
@@ -0,0 +1,162 @@
+import math
+from datetime import datetime
+
+
+def _numpy():
+    # numpy is installed with matplotlib, which plotting needs anyway
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("numpy is required for plotting. Install it with: pip install dab-py[plot]") from e
+    return numpy
+
+
+def _count(obs):
+    return len(obs) if hasattr(obs, "to_numpy") else len(obs.points)
+
+
+def series_arrays(obs):
+    """
+    (times, values) of an Observation or SeriesSlice as float64 numpy arrays,
+    with times in UTC epoch seconds and missing values as NaN.
+    """
+    np = _numpy()
+    if hasattr(obs, "to_numpy"):
+        return obs.to_numpy()
+
+    instants = [p["time"]["instant"] for p in obs.points]
+    values = np.array([p.get("value") for p in obs.points], dtype="f8")
+    if all(s.endswith("Z") for s in instants):
+        # Vectorized ISO-8601 parsing (numpy only accepts naive, i.e. UTC, strings)
+        stamps = np.array([s[:-1] for s in instants], dtype="datetime64[ms]")
+        times = stamps.astype("int64") / 1000.0
+    else:
+        times = np.array([datetime.fromisoformat(s.replace("Z", "+00:00")).timestamp() for s in instants],
+                         dtype="f8")
+    return times, values
+
+
+def minmax_downsample(times, values, n_out):
+    """
+    Keep the minimum and maximum of each of n_out // 2 equal-count buckets.
+    Preserves spikes, which is what a line plot at screen resolution would show.
+    """
+    np = _numpy()
+    n = len(times)
+    n_buckets = max(1, n_out // 2)
+    if n <= n_out:
+        return times, values
+
+    size = math.ceil(n / n_buckets)
+    padded = np.full(n_buckets * size, np.nan)
+    padded[:n] = values
+    rows = padded.reshape(n_buckets, size)
+    offsets = np.arange(n_buckets) * size
+    lo = np.where(np.isnan(rows), np.inf, rows).argmin(axis=1) + offsets
+    hi = np.where(np.isnan(rows), -np.inf, rows).argmax(axis=1) + offsets
+    idx = np.unique(np.concatenate([lo, hi]))
+    idx = idx[idx < n]
+    return times[idx], values[idx]
+
+
+def lttb_downsample(times, values, n_out):
+    """Largest-Triangle-Three-Buckets downsampling to n_out points (NaN values are dropped)."""
+    np = _numpy()
+    mask = ~np.isnan(values)
+    times, values = times[mask], values[mask]
+    n = len(times)
+    if n_out >= n or n_out < 3:
+        return times, values
+
+    # First and last points are kept; the n - 2 inner points are split into n_out - 2 buckets
+    edges = (np.arange(n_out - 1) * ((n - 2) / (n_out - 2))).astype(int) + 1
+    edges[-1] = n - 1
+    selected = np.empty(n_out, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        # The average of the next bucket (the last point for the final bucket) is the third vertex
+        next_stop = edges[i + 2] if i + 2 < len(edges) else n
+        avg_t = times[stop:next_stop].mean()
+        avg_v = values[stop:next_stop].mean()
+        bucket_t, bucket_v = times[start:stop], values[start:stop]
+        areas = np.abs((times[a] - avg_t) * (bucket_v - values[a]) - (times[a] - bucket_t) * (avg_v - values[a]))
+        a = start + int(areas.argmax())
+        selected[i + 1] = a
+    return times[selected], values[selected]
+
+
+_DOWNSAMPLERS = {"minmax": minmax_downsample, "lttb": lttb_downsample}
+
+
+def plot_observations(observations, title=None, downsample="minmax", max_points=None, layout="shared",
+                      ncols=2, figsize=(10, 5), dpi=100, filename=None):
+    """
+    Plot one or many observations (Observation or SeriesSlice).
+
+    downsample: "minmax", "lttb" or None; series are reduced to `max_points`
+    (default: about two points per horizontal pixel of the figure).
+    layout: "shared" draws all series on one axes, "grid" draws small multiples.
+    filename: render headless to this file (no GUI backend) instead of showing.
+    Returns the matplotlib Figure.
+    """
+    observations = [o for o in observations if o is not None and _count(o)]
+    if not observations:
+        print("No data points available for these observations.")
+        return None
+    if downsample not in (None, *_DOWNSAMPLERS):
+        raise ValueError(f"downsample must be one of {sorted(_DOWNSAMPLERS)} or None")
+    if layout not in ("shared", "grid"):
+        raise ValueError('layout must be "shared" or "grid"')
+
+    if layout == "grid":
+        ncols = min(ncols, len(observations))
+        nrows = math.ceil(len(observations) / ncols)
+        figsize = (figsize[0], max(figsize[1], 2.5 * nrows))
+    else:
+        nrows = ncols = 1
+    max_points = max_points or int(2 * figsize[0] * dpi / ncols)
+
+    if filename:
+        # Headless: a bare Figure needs no pyplot state or display
+        from matplotlib.figure import Figure
+        fig = Figure(figsize=figsize, dpi=dpi)
+        axes = fig.subplots(nrows, ncols, sharex=True, squeeze=False)
+    else:
+        from .om_api import _pyplot
+        fig, axes = _pyplot().subplots(nrows, ncols, sharex=True, squeeze=False, figsize=figsize, dpi=dpi)
+    axes = axes.ravel()
+
+    for i, obs in enumerate(observations):
+        times, values = series_arrays(obs)
+        n_in = len(times)
+        if downsample:
+            times, values = _DOWNSAMPLERS[downsample](times, values, max_points)
+        ax = axes[i] if layout == "grid" else axes[0]
+        label = obs.observed_property or obs.id
+        if layout == "shared" and len(observations) > 1:
+            label = f"{label} ({obs.id})"
+        marker = "o-" if n_in <= 200 and len(times) == n_in else "-"
+        ax.plot((times * 1000).astype("int64").astype("datetime64[ms]"), values, marker, label=label, linewidth=0.8, markersize=3)
+        if layout == "grid":
+            ax.set_title(label, fontsize=9)
+            ax.grid(True)
+
+    if layout == "shared":
+        axes[0].set_ylabel("Value")
+        axes[0].grid(True)
+        axes[0].legend()
+    for ax in axes[len(observations):] if layout == "grid" else []:
+        ax.set_visible(False)
+    for ax in axes:
+        ax.tick_params(axis="x", labelrotation=45)
+    fig.suptitle(title or ("Time series" if len(observations) > 1 else f"{observations[0].observed_property} time series"))
+    fig.tight_layout()
+
+    if filename:
+        fig.savefig(filename)
+        print(f"Plot saved to: {filename}")
+    else:
+        _pyplot().show()
+    return fig
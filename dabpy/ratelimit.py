@@ -0,0 +1,151 @@
+import threading
+import time
+import urllib.parse
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+
+ENDPOINT_KINDS = ("features", "observations", "downloads", "other")
+
+
+def parse_retry_after(value):
+    """Retry-After header (delta-seconds or HTTP-date) → seconds to wait, or None."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with AIMD rate adaptation: the rate is halved on
+    throttling and grows back by a small step after every successful request,
+    up to the configured maximum.
+    """
+    def __init__(self, rate, burst=None, min_rate=0.1, recovery=0.05):
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        self.min_rate = min(min_rate, self.max_rate)
+        self.recovery = recovery
+        self.tokens = self.burst
+        self.blocked_until = 0.0
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """Block until a token is available (and any Retry-After pause has passed)."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self.blocked_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = max(self.blocked_until - now, (1 - self.tokens) / self.rate)
+            time.sleep(wait)
+
+    def on_success(self):
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate * self.recovery)
+
+    def on_throttle(self, retry_after=None):
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.tokens = min(self.tokens, 0.0)
+            if retry_after:
+                self.blocked_until = max(self.blocked_until, time.monotonic() + retry_after)
+
+
+class _Governor:
+    """Rate and concurrency limits for one (host, endpoint kind) pair."""
+    def __init__(self, rate, burst, max_concurrency):
+        self.bucket = TokenBucket(rate, burst)
+        self.semaphore = threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+        self.requests = 0
+        self.throttled = 0
+
+
+class RateLimiter:
+    """
+    Client-side rate limiter and concurrency cap per host and endpoint kind
+    (features, observations, downloads, other).
+
+    One instance can be shared by several clients and threads. Defaults apply
+    to every kind; `limits` overrides them per kind, e.g.
+    `RateLimiter(rate=5, max_concurrency=4, limits={"downloads": {"rate": 1, "max_concurrency": 1}})`.
+    429 responses (and 503 with Retry-After) halve the rate of that endpoint
+    and pause it for the Retry-After period; successes slowly restore it.
+    """
+    def __init__(self, rate=5.0, burst=None, max_concurrency=4, limits=None, max_retries=5):
+        unknown = set(limits or {}) - set(ENDPOINT_KINDS)
+        if unknown:
+            raise ValueError(f"Unknown endpoint kind(s): {', '.join(sorted(unknown))}")
+        self.defaults = {"rate": rate, "burst": burst, "max_concurrency": max_concurrency}
+        self.limits = limits or {}
+        self.max_retries = max_retries
+        self._governors = {}
+        self._lock = threading.Lock()
+
+    def _governor(self, key):
+        with self._lock:
+            if key not in self._governors:
+                config = dict(self.defaults, **self.limits.get(key[1], {}))
+                self._governors[key] = _Governor(config["rate"], config["burst"], config["max_concurrency"])
+            return self._governors[key]
+
+    @staticmethod
+    def key(url, kind="other"):
+        return urllib.parse.urlparse(url).netloc, kind
+
+    @contextmanager
+    def slot(self, url, kind="other"):
+        """Hold a concurrency slot and a rate token for one request to `url`."""
+        governor = self._governor(self.key(url, kind))
+        if governor.semaphore:
+            governor.semaphore.acquire()
+        try:
+            governor.bucket.acquire()
+            with self._lock:
+                governor.requests += 1
+            yield governor
+        finally:
+            if governor.semaphore:
+                governor.semaphore.release()
+
+    def record(self, governor, response):
+        """Feed a response back; returns the seconds to wait before retrying, or None if not throttled."""
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if response.status_code == 429 or (response.status_code == 503 and retry_after is not None):
+            with self._lock:
+                governor.throttled += 1
+            governor.bucket.on_throttle(retry_after)
+            return retry_after or 0.0
+        governor.bucket.on_success()
+        return None
+
+    def to_dict(self):
+        with self._lock:
+            governors = [(key, g, g.requests, g.throttled) for key, g in self._governors.items()]
+        return {
+            f"{host} [{kind}]": {
+                "Requests": requests,
+                "Throttled": throttled,
+                "Current Rate": round(g.bucket.rate, 3),
+                "Max Rate": g.bucket.max_rate
+            }
+            for (host, kind), g, requests, throttled in governors
+        }
+
+    def __repr__(self):
+        return f"<RateLimiter endpoints={len(self._governors)}>"
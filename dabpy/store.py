@@ -0,0 +1,200 @@
+import bisect
+import hashlib
+import json
+import math
+import mmap
+import os
+from array import array
+from datetime import datetime, timezone
+from pathlib import Path
+
+_ITEM_SIZE = array("d").itemsize
+
+
+def _to_epoch(instant):
+    """ISO-8601 instant (e.g. 2025-01-01T00:00:00Z) → UTC epoch seconds."""
+    dt = datetime.fromisoformat(instant.replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def _to_instant(epoch):
+    return datetime.fromtimestamp(epoch, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class SeriesSlice:
+    """
+    A time window of one stored series. `times` (UTC epoch seconds) and `values`
+    are float64 memoryviews over the memory-mapped files, i.e. no data is copied.
+    """
+    def __init__(self, observation_id, times, values, observed_property=None):
+        self.id = observation_id
+        self.times = times
+        self.values = values
+        self.observed_property = observed_property
+
+    def __len__(self):
+        return len(self.times)
+
+    @property
+    def points(self):
+        """Points in the OM-JSON shape used by Observation.points (materialized on access)."""
+        return [{"time": {"instant": _to_instant(t)}, "value": None if math.isnan(v) else v}
+                for t, v in zip(self.times, self.values)]
+
+    def to_numpy(self):
+        """(times, values) as numpy arrays sharing memory with the store."""
+        import numpy as np
+        return np.frombuffer(self.times, dtype="f8"), np.frombuffer(self.values, dtype="f8")
+
+    def to_df(self):
+        from .om_api import _pandas
+        pd = _pandas()
+        times, values = self.to_numpy()
+        return pd.DataFrame({"Time": pd.to_datetime(times, unit="s", utc=True), "Value": values})
+
+    def __repr__(self):
+        return f"<SeriesSlice id={self.id} points={len(self)}>"
+
+
+class TimeSeriesStore:
+    """
+    Append-only on-disk store of observation points.
+
+    Each observation is kept in its own directory as two fixed-width float64
+    files (`times.f8` with UTC epoch seconds, `values.f8`) plus a small
+    `index.json` with the time range of every appended chunk. Times are kept
+    strictly increasing, so a time window is located by binary search
+    (O(log n)) and returned as a zero-copy slice of the memory-mapped files.
+    """
+    def __init__(self, root_dir):
+        self.root_dir = Path(root_dir)
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+        self._maps = {}
+
+    def _dir(self, observation_id):
+        # Observation IDs may contain characters that are not valid in file names
+        return self.root_dir / hashlib.sha1(observation_id.encode("utf-8")).hexdigest()
+
+    def _load_index(self, observation_id):
+        path = self._dir(observation_id) / "index.json"
+        if not path.exists():
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save_index(self, observation_id, index):
+        path = self._dir(observation_id) / "index.json"
+        tmp_path = path.with_name("index.json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f)
+        os.replace(tmp_path, path)
+
+    def __contains__(self, observation_id):
+        return self._load_index(observation_id) is not None
+
+    def observation_ids(self):
+        ids = []
+        for path in self.root_dir.glob("*/index.json"):
+            with open(path, "r", encoding="utf-8") as f:
+                ids.append(json.load(f)["observation_id"])
+        return ids
+
+    def info(self, observation_id):
+        """Index entry: point count, overall time range and per-chunk ranges."""
+        index = self._load_index(observation_id)
+        if index is None:
+            raise KeyError(observation_id)
+        return index
+
+    def last_time(self, observation_id):
+        """Instant of the last stored point (useful as `begin` for incremental updates), or None."""
+        index = self._load_index(observation_id)
+        if not index or not index["count"]:
+            return None
+        return _to_instant(index["end"])
+
+    def append(self, observation, points=None):
+        """
+        Append points of an Observation (or `points` for an observation ID).
+        Points not later than the last stored time are skipped, so re-fetching
+        an overlapping window only adds what is new. Returns the number added.
+        """
+        if points is None:
+            observation_id, points = observation.id, observation.points
+            observed_property = getattr(observation, "observed_property", None)
+        else:
+            observation_id, observed_property = observation, None
+
+        index = self._load_index(observation_id) or {
+            "observation_id": observation_id,
+            "observed_property": observed_property,
+            "count": 0,
+            "begin": None,
+            "end": None,
+            "chunks": []
+        }
+        last = index["end"]
+
+        times, values = array("d"), array("d")
+        for p in sorted(points, key=lambda p: _to_epoch(p["time"]["instant"])):
+            t = _to_epoch(p["time"]["instant"])
+            if last is not None and t <= last:
+                continue
+            value = p.get("value")
+            times.append(t)
+            values.append(float("nan") if value is None else float(value))
+            last = t
+        if not times:
+            return 0
+
+        directory = self._dir(observation_id)
+        directory.mkdir(exist_ok=True)
+        # The index is written last; drop any bytes left past it by an interrupted append
+        for name, data in (("times.f8", times), ("values.f8", values)):
+            with open(directory / name, "ab") as f:
+                f.truncate(index["count"] * _ITEM_SIZE)
+                data.tofile(f)
+
+        index["chunks"].append({"offset": index["count"], "count": len(times), "begin": times[0], "end": times[-1]})
+        index["count"] += len(times)
+        index["begin"] = index["begin"] if index["begin"] is not None else times[0]
+        index["end"] = times[-1]
+        if observed_property and not index["observed_property"]:
+            index["observed_property"] = observed_property
+        self._save_index(observation_id, index)
+
+        # Existing slices keep their (shorter) maps alive; new reads remap the grown files
+        self._maps.pop(observation_id, None)
+        return len(times)
+
+    def _arrays(self, observation_id, count):
+        cached = self._maps.get(observation_id)
+        if cached and len(cached[0]) == count:
+            return cached
+        directory = self._dir(observation_id)
+        arrays = []
+        for name in ("times.f8", "values.f8"):
+            with open(directory / name, "rb") as f:
+                m = mmap.mmap(f.fileno(), count * _ITEM_SIZE, access=mmap.ACCESS_READ)
+            arrays.append(memoryview(m).cast("d"))
+        self._maps[observation_id] = tuple(arrays)
+        return self._maps[observation_id]
+
+    def read(self, observation_id, begin=None, end=None):
+        """Points with begin <= time <= end (ISO instants, both optional) as a zero-copy SeriesSlice."""
+        index = self._load_index(observation_id)
+        if index is None:
+            raise KeyError(observation_id)
+        if not index["count"]:
+            return SeriesSlice(observation_id, memoryview(array("d")), memoryview(array("d")),
+                               index["observed_property"])
+
+        times, values = self._arrays(observation_id, index["count"])
+        lo = bisect.bisect_left(times, _to_epoch(begin)) if begin else 0
+        hi = bisect.bisect_right(times, _to_epoch(end)) if end else len(times)
+        return SeriesSlice(observation_id, times[lo:hi], values[lo:hi], index["observed_property"])
+
+    def __repr__(self):
+        return f"<TimeSeriesStore root={self.root_dir}>"
@@ -0,0 +1,108 @@
+import json
+import threading
+
+
+def accept_encoding(compression=True):
+    """
+    Accept-Encoding header value for DAB requests.
+    urllib3 lists gzip/deflate, plus br and zstd when the optional
+    `brotli` / `zstandard` packages are installed (pip install dab-py[compression]).
+    """
+    if not compression:
+        return "identity"
+    from urllib3.util import make_headers
+    return make_headers(accept_encoding=True)["accept-encoding"]
+
+
+class TransferStats:
+    """
+    Bytes received over the wire vs. bytes after decompression.
+    Thread-safe: one instance is shared by all requests of a client, including
+    concurrent ones (e.g. per-feature queries in get_features_with_observations).
+    Under concurrency `last_*` refer to whichever request finished last.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._zero()
+
+    def _zero(self):
+        self.requests = 0
+        self.wire_bytes = 0
+        self.decoded_bytes = 0
+        self.last_wire_bytes = 0
+        self.last_decoded_bytes = 0
+        self.encodings = {}
+
+    def record(self, wire_bytes, decoded_bytes, encoding=None):
+        encoding = encoding or "identity"
+        with self._lock:
+            self.requests += 1
+            self.wire_bytes += wire_bytes
+            self.decoded_bytes += decoded_bytes
+            self.last_wire_bytes = wire_bytes
+            self.last_decoded_bytes = decoded_bytes
+            self.encodings[encoding] = self.encodings.get(encoding, 0) + 1
+
+    @property
+    def ratio(self):
+        """Compression ratio (decoded / wire); 1.0 when nothing was compressed."""
+        return self.decoded_bytes / self.wire_bytes if self.wire_bytes else 1.0
+
+    @property
+    def saved_bytes(self):
+        return self.decoded_bytes - self.wire_bytes
+
+    def reset(self):
+        with self._lock:
+            self._zero()
+
+    def to_dict(self):
+        with self._lock:
+            return {
+                "Requests": self.requests,
+                "Wire Bytes": self.wire_bytes,
+                "Decoded Bytes": self.decoded_bytes,
+                "Saved Bytes": self.saved_bytes,
+                "Compression Ratio": round(self.ratio, 2),
+                "Encodings": dict(self.encodings)
+            }
+
+    def __repr__(self):
+        return f"<TransferStats wire={self.wire_bytes} decoded={self.decoded_bytes} ratio={self.ratio:.2f}>"
+
+
+def _wire_bytes(resp, fallback):
+    # urllib3 reports how many (possibly compressed) bytes were read from the socket
+    try:
+        return resp.raw.tell()
+    except (AttributeError, OSError):
+        return fallback
+
+
+def read_json(resp, stats=None, chunk_size=65536, exchange=None):
+    """
+    Read a streamed (stream=True) JSON response, recording wire vs. decoded bytes.
+    Reading through iter_content keeps requests' exception wrapping, so body read
+    timeouts / truncation surface as requests.ConnectionError / ChunkedEncodingError.
+    `exchange` (a dict) receives the "wire_bytes" / "decoded_bytes" of this response.
+    """
+    chunks = [chunk for chunk in resp.iter_content(chunk_size) if chunk]
+    body = b"".join(chunks)
+    wire_bytes = _wire_bytes(resp, len(body))
+    if stats is not None:
+        stats.record(wire_bytes, len(body), resp.headers.get("Content-Encoding"))
+    if exchange is not None:
+        exchange.update(wire_bytes=wire_bytes, decoded_bytes=len(body))
+    return json.loads(body)
+
+
+def stream_to_file(resp, f, stats=None, chunk_size=8192):
+    """Write a streamed (stream=True) response to the open binary file `f`, decompressing chunk by chunk."""
+    decoded = 0
+    for chunk in resp.iter_content(chunk_size):
+        if chunk:
+            f.write(chunk)
+            decoded += len(chunk)
+    if stats is not None:
+        stats.record(_wire_bytes(resp, decoded), decoded, resp.headers.get("Content-Encoding"))
+    return decoded
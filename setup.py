@@ -5,10 +5,14 @@ setup(
     version="1.1.0",
     packages=find_packages(),
     install_requires=[
-        "requests",
-        "pandas",
-        "matplotlib"
+        "requests"
     ],
+    extras_require={
+        "pandas": ["pandas"],
+        "plot": ["matplotlib"],
+        "compression": ["brotli", "zstandard"],
+        "all": ["pandas", "matplotlib", "brotli", "zstandard"]
+    },
     license="AGPL-3.0",
     author="Alun Sagara Putra (CNR Internship)",
     description="A Python client for DAB Terms API and DAB API (WHOS / HIS-Central API)",
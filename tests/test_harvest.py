@@ -0,0 +1,98 @@
+import json
+
+import pytest
+
+from dabpy import Constraints, HarvestJob
+
+
+class StubClient:
+    """Serves fixed pages / observations without network access; can fail on a given call."""
+    def __init__(self, pages=None, fail_at=None):
+        self.pages = pages or []
+        self.fail_at = fail_at
+        self.calls = []
+
+    def _call(self, what):
+        self.calls.append(what)
+        if self.fail_at is not None and len(self.calls) == self.fail_at:
+            raise ConnectionError("stub failure")
+
+    def _page_sizer(self, adaptive, constraints):
+        return None
+
+    def _get_page(self, endpoint, constraints, resumption_token, page, page_sizer=None, verbose=True):
+        self._call(("page", page))
+        return self.pages[page - 1]
+
+    def _get_observation_data_json(self, observation_id, begin=None, end=None, verbose=True):
+        self._call(("data", observation_id))
+        return {"id": observation_id, "begin": begin}
+
+
+def _pages(n):
+    return [
+        {"member": [{"id": f"o{i}"}], "resumptionToken": f"t{i}" if i < n else None, "completed": i == n}
+        for i in range(1, n + 1)
+    ]
+
+
+def _job(tmp_path, client):
+    return HarvestJob(client, tmp_path / "checkpoint.json", tmp_path / "out.jsonl", verbose=False)
+
+
+def test_run_pages_resumes_after_failure(tmp_path):
+    constraints = Constraints(bbox=(0, 0, 1, 1))
+    with pytest.raises(ConnectionError):
+        _job(tmp_path, StubClient(_pages(3), fail_at=2)).run_pages(constraints, "observations")
+
+    client = StubClient(_pages(3))
+    job = _job(tmp_path, client).run_pages(constraints, "observations")
+    assert client.calls == [("page", 2), ("page", 3)]
+    assert [r["id"] for r in job.records()] == ["o1", "o2", "o3"]
+    assert job.completed
+
+
+def test_completed_job_fetches_nothing(tmp_path):
+    constraints = Constraints(bbox=(0, 0, 1, 1))
+    _job(tmp_path, StubClient(_pages(2))).run_pages(constraints, "observations")
+    client = StubClient(_pages(2))
+    _job(tmp_path, client).run_pages(constraints, "observations")
+    assert client.calls == []
+
+
+def test_partial_write_is_truncated_on_resume(tmp_path):
+    constraints = Constraints(bbox=(0, 0, 1, 1))
+    job = _job(tmp_path, StubClient(_pages(3))).run_pages(constraints, "observations", max_pages=1)
+    with open(tmp_path / "out.jsonl", "ab") as f:
+        f.write(b'{"id": "half')
+    job = _job(tmp_path, StubClient(_pages(3))).run_pages(constraints, "observations")
+    assert [r["id"] for r in job.records()] == ["o1", "o2", "o3"]
+
+
+def test_other_harvest_checkpoint_is_rejected(tmp_path):
+    _job(tmp_path, StubClient(_pages(1))).run_pages(Constraints(bbox=(0, 0, 1, 1)), "observations")
+    with pytest.raises(ValueError):
+        _job(tmp_path, StubClient(_pages(1))).run_pages(Constraints(bbox=(0, 0, 2, 2)), "observations")
+
+
+def test_existing_output_is_not_overwritten(tmp_path):
+    (tmp_path / "out.jsonl").write_text("keep\n")
+    with pytest.raises(FileExistsError):
+        _job(tmp_path, StubClient(_pages(1))).run_pages(Constraints(bbox=(0, 0, 1, 1)), "observations")
+    assert (tmp_path / "out.jsonl").read_text() == "keep\n"
+
+
+def test_observation_data_resumes_by_position(tmp_path):
+    ids = ["a", "b", "c", "d"]
+    with pytest.raises(ConnectionError):
+        _job(tmp_path, StubClient(fail_at=3)).run_observation_data(ids, begin="2025-01-01T00:00:00Z")
+
+    state = json.loads((tmp_path / "checkpoint.json").read_text())
+    assert state["position"] == 2
+    assert len(state["key"]) == 40  # sha1 of the ID list, not the list itself
+
+    client = StubClient()
+    job = _job(tmp_path, client).run_observation_data(ids, begin="2025-01-01T00:00:00Z")
+    assert client.calls == [("data", "c"), ("data", "d")]
+    assert [r["id"] for r in job.records()] == ids
+    assert job.to_dict()["Completed Observations"] == 4
@@ -0,0 +1,66 @@
+import pytest
+
+from dabpy import AdaptivePageSizer
+
+
+def test_rejects_inconsistent_bounds():
+    with pytest.raises(ValueError):
+        AdaptivePageSizer(initial_limit=10, min_limit=20)
+
+
+def test_grows_towards_target_latency():
+    sizer = AdaptivePageSizer(initial_limit=50, max_limit=1000, target_seconds=2.0)
+    # 50 items in 0.1 s -> 2 ms per item; growth is capped at 2x per page
+    assert sizer.record_success(50, 50, 0.1, 5000, completed=False) == 100
+    assert sizer.record_success(100, 100, 0.2, 10000, completed=False) == 200
+
+
+def test_respects_max_bytes():
+    sizer = AdaptivePageSizer(initial_limit=100, target_seconds=10.0, max_bytes=20000)
+    # 200 bytes per item -> at most 100 items per page
+    assert sizer.record_success(100, 100, 0.1, 20000, completed=False) == 100
+
+
+def test_error_halves_limit():
+    sizer = AdaptivePageSizer(initial_limit=200)
+    assert sizer.record_error(200, TimeoutError()) == 100
+    assert sizer.errors == 1
+    assert sizer.error_rate == 1.0
+    assert sizer.history[-1]["Error"] == "TimeoutError"
+
+
+def test_single_short_page_does_not_pin_cap():
+    sizer = AdaptivePageSizer(initial_limit=200, target_seconds=100.0)
+    sizer.record_success(200, 3, 0.01, 300, completed=False)
+    assert sizer.server_limit is None
+    # Full pages afterwards keep growing up to max_limit
+    for _ in range(5):
+        sizer.record_success(sizer.limit, sizer.limit, 0.01, 100, completed=False)
+    assert sizer.limit == sizer.max_limit
+
+
+def test_repeated_short_page_pins_cap():
+    sizer = AdaptivePageSizer(initial_limit=200, target_seconds=100.0)
+    sizer.record_success(200, 100, 0.01, 1000, completed=False)
+    sizer.record_success(200, 100, 0.01, 1000, completed=False)
+    assert sizer.server_limit == 100
+    assert sizer.limit == 100
+
+
+def test_last_page_is_not_cap_evidence():
+    sizer = AdaptivePageSizer(initial_limit=200)
+    sizer.record_success(200, 100, 0.01, 1000, completed=True)
+    sizer.record_success(200, 100, 0.01, 1000, completed=True)
+    assert sizer.server_limit is None
+
+
+def test_probe_above_cap_drops_it_when_full():
+    sizer = AdaptivePageSizer(initial_limit=200, target_seconds=100.0, probe_after=2)
+    sizer.record_success(200, 100, 0.01, 1000, completed=False)
+    sizer.record_success(200, 100, 0.01, 1000, completed=False)
+    assert sizer.server_limit == 100
+    sizer.record_success(100, 100, 0.01, 1000, completed=False)
+    probe = sizer.record_success(100, 100, 0.01, 1000, completed=False)
+    assert probe > 100
+    sizer.record_success(probe, probe, 0.01, 1000, completed=False)
+    assert sizer.server_limit is None
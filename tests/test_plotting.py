@@ -0,0 +1,50 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from dabpy.plotting import lttb_downsample, minmax_downsample  # noqa: E402
+
+
+def _series(n):
+    times = np.arange(n, dtype="f8")
+    values = np.sin(times / 50.0)
+    return times, values
+
+
+def test_minmax_keeps_short_series():
+    times, values = _series(10)
+    out_t, out_v = minmax_downsample(times, values, 100)
+    assert len(out_t) == 10
+
+
+def test_minmax_preserves_spikes():
+    times, values = _series(10000)
+    values[1234], values[8765] = 50.0, -50.0
+    out_t, out_v = minmax_downsample(times, values, 200)
+    assert len(out_t) <= 200
+    assert out_v.max() == 50.0 and out_v.min() == -50.0
+    assert np.all(np.diff(out_t) > 0)
+
+
+def test_minmax_ignores_nan_buckets():
+    times, values = _series(1000)
+    values[:500] = np.nan
+    out_t, out_v = minmax_downsample(times, values, 100)
+    assert np.nanmax(out_v) == np.nanmax(values)
+
+
+def test_lttb_returns_requested_count_with_endpoints():
+    times, values = _series(10000)
+    out_t, out_v = lttb_downsample(times, values, 300)
+    assert len(out_t) == 300
+    assert out_t[0] == times[0] and out_t[-1] == times[-1]
+    assert np.all(np.diff(out_t) > 0)
+
+
+def test_lttb_drops_nan_and_keeps_spike():
+    times, values = _series(5000)
+    values[10:20] = np.nan
+    values[2500] = 100.0
+    out_t, out_v = lttb_downsample(times, values, 100)
+    assert not np.isnan(out_v).any()
+    assert 100.0 in out_v
@@ -0,0 +1,68 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from dabpy import RateLimiter
+from dabpy.ratelimit import TokenBucket, parse_retry_after
+
+
+class StubResponse:
+    def __init__(self, status_code, retry_after=None):
+        self.status_code = status_code
+        self.headers = {"Retry-After": retry_after} if retry_after is not None else {}
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+
+def test_token_bucket_aimd():
+    bucket = TokenBucket(rate=10, min_rate=1, recovery=0.1)
+    bucket.on_throttle()
+    assert bucket.rate == 5
+    bucket.on_success()
+    assert bucket.rate == 6
+    for _ in range(20):
+        bucket.on_success()
+    assert bucket.rate == 10
+
+
+def test_unknown_kind_is_rejected():
+    with pytest.raises(ValueError):
+        RateLimiter(limits={"bogus": {"rate": 1}})
+
+
+def test_throttle_is_recorded_per_endpoint():
+    limiter = RateLimiter(rate=100)
+    with limiter.slot("https://dab.example/api/observations", "observations") as governor:
+        assert limiter.record(governor, StubResponse(429, "0")) == 0.0
+    with limiter.slot("https://dab.example/api/features", "features") as governor:
+        assert limiter.record(governor, StubResponse(200)) is None
+
+    stats = limiter.to_dict()
+    assert stats["dab.example [observations]"]["Throttled"] == 1
+    assert stats["dab.example [observations]"]["Current Rate"] == 50
+    assert stats["dab.example [features]"]["Throttled"] == 0
+
+
+def test_concurrency_cap_and_request_count():
+    limiter = RateLimiter(rate=1e6, burst=1e6, max_concurrency=2)
+    lock = threading.Lock()
+    active, peak = [0], [0]
+
+    def request(_):
+        with limiter.slot("https://dab.example/api/features", "features"):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            with lock:
+                active[0] -= 1
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(request, range(2000)))
+    assert peak[0] <= 2
+    assert limiter.to_dict()["dab.example [features]"]["Requests"] == 2000
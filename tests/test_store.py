@@ -0,0 +1,68 @@
+import math
+
+import pytest
+
+from dabpy import TimeSeriesStore
+
+
+def _points(hours, value=None):
+    return [{"time": {"instant": f"2025-01-01T{h:02d}:00:00Z"}, "value": h if value is None else value}
+            for h in hours]
+
+
+def test_append_and_read_all(tmp_path):
+    store = TimeSeriesStore(tmp_path)
+    assert store.append("obs/1", points=_points(range(5))) == 5
+    series = store.read("obs/1")
+    assert len(series) == 5
+    assert list(series.values) == [0, 1, 2, 3, 4]
+    assert store.last_time("obs/1") == "2025-01-01T04:00:00Z"
+    assert store.observation_ids() == ["obs/1"]
+
+
+def test_overlapping_append_only_adds_new_points(tmp_path):
+    store = TimeSeriesStore(tmp_path)
+    store.append("obs", points=_points(range(3)))
+    assert store.append("obs", points=_points(range(1, 6))) == 3
+    assert list(store.read("obs").values) == [0, 1, 2, 3, 4, 5]
+    assert len(store.info("obs")["chunks"]) == 2
+
+
+def test_read_window_is_inclusive(tmp_path):
+    store = TimeSeriesStore(tmp_path)
+    store.append("obs", points=_points(range(10)))
+    window = store.read("obs", begin="2025-01-01T02:00:00Z", end="2025-01-01T05:00:00Z")
+    assert list(window.values) == [2, 3, 4, 5]
+    assert len(store.read("obs", begin="2025-01-01T02:30:00Z", end="2025-01-01T02:45:00Z")) == 0
+
+
+def test_missing_values_are_nan(tmp_path):
+    store = TimeSeriesStore(tmp_path)
+    store.append("obs", points=[{"time": {"instant": "2025-01-01T00:00:00Z"}, "value": None}])
+    series = store.read("obs")
+    assert math.isnan(series.values[0])
+    assert series.points[0]["value"] is None
+
+
+def test_bytes_past_the_index_are_dropped(tmp_path):
+    store = TimeSeriesStore(tmp_path)
+    store.append("obs", points=_points(range(3)))
+    # Simulate an append interrupted after writing data but before the index
+    directory = store._dir("obs")
+    for name in ("times.f8", "values.f8"):
+        with open(directory / name, "ab") as f:
+            f.write(b"\0" * 12)
+
+    reopened = TimeSeriesStore(tmp_path)
+    assert len(reopened.read("obs")) == 3
+    reopened.append("obs", points=_points([3]))
+    assert list(reopened.read("obs").values) == [0, 1, 2, 3]
+    assert (directory / "times.f8").stat().st_size == 4 * 8
+
+
+def test_unknown_observation_raises(tmp_path):
+    store = TimeSeriesStore(tmp_path)
+    assert "missing" not in store
+    assert store.last_time("missing") is None
+    with pytest.raises(KeyError):
+        store.read("missing")